@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import inspect
 from typing import TYPE_CHECKING, Any, Callable, Coroutine, Literal, Type, TypeVar, overload
 
 from .errors import DependencyException, GroupAlreadyAdded
@@ -12,6 +11,7 @@ from .routing import (
     RouteType,
     WebSocketRoute,
     WSRouteCallback,
+    _cached_signature,
     _create_http_route,
     route as route_selector,
 )
@@ -130,11 +130,14 @@ class Application(BaseASGIApp):
 
         match scope["type"]:
             case "http":
-                request = Request(scope, receive, send)
-
-                for middleware in self._middleware:
-                    await middleware(request)
-                await self._state.router(request)
+                request = Request._acquire(scope, receive, send)
+
+                try:
+                    for middleware in self._middleware:
+                        await middleware(request)
+                    await self._state.router(request)
+                finally:
+                    Request._release(request)
             case "lifespan":
                 await self._state.router.lifespan(scope, receive, send)
             case "websocket":
@@ -148,7 +151,10 @@ class Application(BaseASGIApp):
 
     def add_route(self, route: RouteType, /) -> None:
         route._state = self._state
-        route._compile_path(inspect.signature(route.callback if isinstance(route, Route) else route.on_connect))
+        if not route._compiled:
+            # registration is the only compile point; re-adding a route (or
+            # sharing one between apps) must not redo converter setup
+            route._compile_path(_cached_signature(route.callback if isinstance(route, Route) else route.on_connect))
         self._state.router.routes.append(route)
 
     @mimmic(_create_http_route, keep_return=True)
@@ -1,19 +1,20 @@
 from __future__ import annotations
 
 import datetime
-import re
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Callable, Self, Type
+from typing import Any, Type
 
 from .utils import MISSING
 
-al = r".*"
-
 __all__ = ("Converter",)
 
 
 class Converter(ABC):
     regex: str
+    # set this to True when convert() is deterministic for a given value; the
+    # router only caches converted path params for routes whose converters are
+    # all pure
+    pure: bool = False
 
     def __init__(self, *, regex: str = MISSING) -> None:
         if regex:
@@ -34,6 +35,8 @@ class Converter(ABC):
 
 
 class FloatConverter(Converter, regex=r"[0-9]*.[0-9]*"):
+    pure = True
+
     def convert(self, value: str) -> float:
         if "." in value:
             return float(value)
@@ -42,11 +45,15 @@ class FloatConverter(Converter, regex=r"[0-9]*.[0-9]*"):
 
 
 class IntConverter(Converter, regex=r"[0-9]*"):
+    pure = True
+
     def convert(self, value: str) -> int:
         return int(value)
 
 
 class DatetimeConverter(Converter):
+    pure = True
+
     def convert(self, inp: str) -> datetime.datetime:
         try:
             return datetime.datetime.fromtimestamp(float(inp))
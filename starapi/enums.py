@@ -1,13 +1,13 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 
-class Match(Enum):
+class Match(IntEnum):
     NONE = 0
     PARTIAL = 1
     FULL = 2
 
 
-class WSState(Enum):
+class WSState(IntEnum):
     connecting = 0
     connected = 1
     disconnected = 2
@@ -22,7 +22,7 @@ class WSMessageType(Enum):
     close = "websocket.close"
 
 
-class WSCodes(Enum):
+class WSCodes(IntEnum):
     NORMAL_CLOSURE = 1000
     GOING_AWAY = 1001
     PROTOCOL_ERROR = 1002
@@ -40,7 +40,7 @@ class WSCodes(Enum):
     TLS_HANDSHAKE = 1015
 
 
-class HTTPCodes(Enum):
+class HTTPCodes(IntEnum):
     CONTINUE = 100
     SWITCHING_PROTOCOLS = 101
     PROCESSING = 102
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-import json
+from functools import cache
 from typing import TYPE_CHECKING, Type
 
 from .utils import MISSING
 
 try:
     import msgspec
-    import msgspec._json_schema
 except ImportError:
     msgspec = MISSING
 
@@ -20,6 +19,13 @@ if TYPE_CHECKING:
 __all__ = ("OpenAPI", "Contact")
 
 
+@cache
+def _convert_to_openapi_type(python_type: Type) -> dict:
+    # annotations repeat across parameters and routes (str, int, list[int],
+    # ...), so the schema build only ever runs once per type
+    return msgspec.json.schema(python_type)
+
+
 class Contact:
     def __init__(self, name: str, email: str, url: str) -> None:
         self.name = name
@@ -68,6 +74,7 @@ class OpenAPI:
 
         self._objects_queue: list[Type[Struct]] = []
         self._status: bool = False
+        self._saved_hashes: dict[str, int] = {}
 
     @property
     def contact(self) -> Contact | None:
@@ -147,15 +154,9 @@ class OpenAPI:
         self._version = new
         self._current["info"]["version"] = new
 
-    def _convert_to_openapi_type(self, python_type: Type) -> dict:
-        translator = msgspec.inspect._Translator([python_type])
-        t, args, _ = msgspec.inspect._origin_args_metadata(python_type)
-        msgspec_type = translator._translate_inner(t, args)
-        return msgspec._json_schema._to_schema(msgspec_type, {}, "#/$defs/{name}", False)
-
     def generate_param_spec(self, param: Parameter) -> dict:
         schema = {"title": param.name.title()}
-        schema.update(self._convert_to_openapi_type(param.annotation))
+        schema.update(_convert_to_openapi_type(param.annotation))
         return {
             "required": param.required,
             "name": param.name,
@@ -208,8 +209,17 @@ class OpenAPI:
             paths[route.clean_path][method.lower()] = route_data
 
     def save(self, fp: str, *, indent: int = 4) -> None:
-        with open(fp, "w", encoding="utf-8") as f:
-            json.dump(self.current, f, indent=indent)
+        payload = msgspec.json.format(msgspec.json.encode(self.current), indent=indent)
+
+        # rebuilds are common during development; skip the disk write when the
+        # schema hasn't actually changed
+        key = hash(payload)
+        if self._saved_hashes.get(fp) == key:
+            return
+
+        with open(fp, "wb") as f:
+            f.write(payload)
+        self._saved_hashes[fp] = key
 
     def __repr__(self) -> str:
         x = [
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from functools import cache, partial
 from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Generic, Literal, Sequence, TypeVar, overload
 from urllib.parse import parse_qs
 
@@ -34,7 +35,7 @@ except ImportError:
 if TYPE_CHECKING:
     from typing_extensions import TypeVar
 
-    from ._types import Decoder, Receive, Scope, Send, WSMessage
+    from ._types import HTTPMessage, Receive, Scope, Send, WSMessage
     from .app import Application
     from .routing import Route
 
@@ -45,6 +46,52 @@ else:
 
 __all__ = ("Request", "WebSocket")
 
+_PAYLOAD_FORMATS = {
+    "application/x-yaml": "yaml",
+    "text/yaml": "yaml",
+    "application/toml": "toml",
+    "application/json": "json",
+    "application/msgpack": "msgpack",
+    "application/x-msgpack": "msgpack",
+}
+
+if msgspec is not None:
+
+    @cache
+    def _payload_decoder(format_: str, payload: Any) -> Callable[[bytes], Any]:
+        # json/msgpack get a Decoder specialized to the payload type, built
+        # once per (format, type); yaml/toml have no Decoder class, so they
+        # keep the module function with type= bound
+        if format_ == "json":
+            return msgspec.json.Decoder(payload).decode
+        if format_ == "msgpack":
+            return msgspec.msgpack.Decoder(payload).decode
+        decode = msgspec.yaml.decode if format_ == "yaml" else msgspec.toml.decode
+        return partial(decode, type=payload)
+
+
+# (current state, incoming message type) -> next state, precomputed so the
+# per-frame hot path is a single dict lookup instead of nested match/if chains
+_WS_RECV_TRANSITIONS: dict[tuple[WSState, str], WSState] = {
+    (WSState.connecting, WSMessageType.connect.value): WSState.connected,
+    (WSState.connected, WSMessageType.receive.value): WSState.connected,
+    (WSState.connected, WSMessageType.disconnect.value): WSState.disconnected,
+}
+_WS_SEND_TRANSITIONS: dict[tuple[WSState, str], WSState] = {
+    (WSState.connecting, WSMessageType.accept.value): WSState.connected,
+    (WSState.connecting, WSMessageType.close.value): WSState.disconnected,
+    (WSState.connected, WSMessageType.send.value): WSState.connected,
+    (WSState.connected, WSMessageType.close.value): WSState.disconnected,
+}
+_WS_RECV_EXPECTED: dict[WSState, Any] = {
+    WSState.connecting: WSMessageType.connect,
+    WSState.connected: [WSMessageType.disconnect, WSMessageType.receive],
+}
+_WS_SEND_EXPECTED: dict[WSState, Any] = {
+    WSState.connecting: [WSMessageType.close, WSMessageType.accept],
+    WSState.connected: [WSMessageType.close, WSMessageType.send],
+}
+
 
 class Address:
     def __init__(self, data: Sequence):
@@ -68,6 +115,20 @@ def _ws_must_be_connected(func: FuncT) -> FuncT:
 class BaseRequest(Generic[AppT]):
     _type: str
 
+    __slots__ = (
+        "_scope",
+        "_receive",
+        "_send",
+        "_type",
+        "_stream_consumed",
+        "_is_disconnected",
+        "user",
+        "_cached_properties",
+        # lazily created; holds only cached_property values so hits resolve
+        # straight through instance-attribute lookup
+        "__dict__",
+    )
+
     def __init__(self, scope: Scope, receive: Receive, send: Send) -> None:
         self._scope = scope
         self._receive = receive
@@ -75,6 +136,7 @@ class BaseRequest(Generic[AppT]):
         self._type = scope["type"]
 
         self._stream_consumed = False
+        self._is_disconnected = False
         self.user: Any = None
 
     @property
@@ -143,6 +205,8 @@ class BaseRequest(Generic[AppT]):
 class WebSocket(BaseRequest, Generic[AppT]):
     _type: Literal["websocket"]
 
+    __slots__ = ("client_state", "application_state")
+
     def __init__(self, scope: Scope, receive: Receive, send: Send) -> None:
         super().__init__(scope, receive, send)
 
@@ -150,49 +214,25 @@ class WebSocket(BaseRequest, Generic[AppT]):
         self.application_state = WSState.connecting
 
     async def receive(self) -> WSMessage:
-        match self.client_state:
-            case WSState.connecting:
-                msg = await self._receive()
-                if msg["type"] != WSMessageType.connect.value:
-                    raise UnexpectedASGIMessageType(WSMessageType.connect, msg["type"])
-                self.client_state = WSState.connected
-                return msg
-            case WSState.connected:
-                msg = await self._receive()
-                typ = WSMessageType(msg["type"])
-                if typ == WSMessageType.disconnect:
-                    self.client_state = WSState.disconnected
-                elif typ not in (
-                    WSMessageType.disconnect,
-                    WSMessageType.receive,
-                ):
-                    raise UnexpectedASGIMessageType([WSMessageType.disconnect, WSMessageType.receive], typ.value)
-                return msg  # type: ignore
-            case other:
-                raise RuntimeError("Disconnect message has already been received")
+        if self.client_state == WSState.disconnected:
+            raise RuntimeError("Disconnect message has already been received")
+
+        msg = await self._receive()
+        next_state = _WS_RECV_TRANSITIONS.get((self.client_state, msg["type"]))
+        if next_state is None:
+            raise UnexpectedASGIMessageType(_WS_RECV_EXPECTED[self.client_state], msg["type"])
+        self.client_state = next_state
+        return msg  # type: ignore
 
     async def send(self, msg: WSMessage) -> None:
-        match self.application_state:
-            case WSState.connecting:
-                match WSMessageType(msg["type"]):
-                    case WSMessageType.accept:
-                        self.application_state = WSState.connected
-                    case WSMessageType.close:
-                        self.application_state = WSState.disconnected
-                    case other:
-                        raise UnexpectedASGIMessageType([WSMessageType.close, WSMessageType.accept], msg["type"])
-                await self._send(msg)
-            case WSState.connected:
-                match WSMessageType(msg["type"]):
-                    case WSMessageType.close:
-                        self.application_state = WSState.disconnected
-                    case WSMessageType.send:
-                        pass
-                    case other:
-                        raise UnexpectedASGIMessageType([WSMessageType.close, WSMessageType.send], other.value)
-                await self._send(msg)
-            case other:
-                raise RuntimeError("Websocket has already been closed")
+        if self.application_state == WSState.disconnected:
+            raise RuntimeError("Websocket has already been closed")
+
+        next_state = _WS_SEND_TRANSITIONS.get((self.application_state, msg["type"]))
+        if next_state is None:
+            raise UnexpectedASGIMessageType(_WS_SEND_EXPECTED[self.application_state], msg["type"])
+        self.application_state = next_state
+        await self._send(msg)
 
     async def accept(
         self,
@@ -301,10 +341,41 @@ class WebSocket(BaseRequest, Generic[AppT]):
 class Request(BaseRequest, Generic[AppT]):
     _type: Literal["http"]
 
+    __slots__ = ()
+
+    # recycled instances; asyncio runs a loop per thread, so a plain
+    # class-level free list is safe here
+    _pool: list[Request] = []
+
+    @classmethod
+    def _acquire(cls, scope: Scope, receive: Receive, send: Send) -> Request:
+        pool = cls._pool
+        if pool:
+            self = pool.pop()
+            self.__init__(scope, receive, send)
+            return self
+        return cls(scope, receive, send)
+
+    @classmethod
+    def _release(cls, request: Request) -> None:
+        pool = cls._pool
+        if len(pool) < 256:
+            request._scope = request._receive = request._send = None  # type: ignore
+            request.user = None
+            request._cached_properties = None  # type: ignore # reset lazily-built caches
+            request.__dict__.clear()
+            pool.append(request)
+
     @property
     def is_disconnected(self) -> bool:
         return self._is_disconnected
 
+    async def _send_response(self, start: HTTPMessage, body: HTTPMessage) -> None:
+        # submit both messages with no work in between so servers that
+        # coalesce consecutive sends can batch them into one write
+        await self._send(start)
+        await self._send(body)
+
     @property
     def method(self) -> str:
         return self._scope["method"]
@@ -373,25 +444,12 @@ class Request(BaseRequest, Generic[AppT]):
         if payload is None:
             raise RuntimeError("The route must have a set payload to use this")
 
-        content_type = self.headers.get("content-type", None)
-        if content_type in ("application/x-yaml", "text/yaml"):
-            format_ = "yaml"
-        elif content_type == "application/toml":
-            format_ = "toml"
-        elif content_type == "application/json":
-            format_ = "json"
-        elif content_type in ("application/msgpack", "application/x-msgpack"):
-            format_ = "msgpack"
-        else:
-            format_ = None
-
-        if format_ is None:
-            decoder = self.app._state.default_decoder
-        else:
-            decoder: Decoder = eval(f"msgspec.{format_}.decode")
+        format_ = _PAYLOAD_FORMATS.get(self.headers.get("content-type"))
 
         try:
-            return decoder(await self.body(), type=payload)
+            if format_ is None:
+                return self.app._state.default_decoder(await self.body(), type=payload)
+            return _payload_decoder(format_, payload)(await self.body())
         except msgspec.ValidationError as e:
             raise PayloadValidationException(f"{e}")
         except msgspec.DecodeError:
@@ -428,7 +486,8 @@ class Request(BaseRequest, Generic[AppT]):
             return FormData()
 
     async def close(self) -> None:
-        cache = getattr(self, "__cached_properties", {})
+        # pool-recycled instances carry None here until a cached property runs
+        cache = getattr(self, "_cached_properties", None) or {}
         form = cache.get("form", None)
         if form:
             await cache["form"].close()
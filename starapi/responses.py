@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import json
+import re
+from functools import lru_cache
+from http import HTTPStatus
 from typing import TYPE_CHECKING, Any, Optional, Self
 from urllib.parse import quote
 
@@ -22,10 +25,97 @@ else:
 
 __all__ = ("Response",)
 
+_STATUS_LINES: dict[int, bytes] = {
+    status.value: f"{status.value} {status.phrase}".encode("latin-1") for status in HTTPStatus
+}
+
+if msgspec is not None:
+    # reusable encoder instances amortize their output buffers across calls;
+    # yaml/toml have no Encoder class, so those stay module functions
+    _json_encoder = msgspec.json.Encoder().encode
+    _msgpack_encoder = msgspec.msgpack.Encoder().encode
+
+    # accept header -> bound encoder, resolved once at import so the response
+    # hot path is a single dict lookup instead of an eval + attribute walk
+    _ENCODERS: dict[str, Encoder] = {
+        "application/json": _json_encoder,
+        "application/x-yaml": msgspec.yaml.encode,
+        "text/yaml": msgspec.yaml.encode,
+        "application/toml": msgspec.toml.encode,
+        "application/msgpack": _msgpack_encoder,
+        "application/x-msgpack": _msgpack_encoder,
+    }
+else:
+    _ENCODERS = {}
+
+
+@lru_cache(maxsize=256)
+def _resolve_encoder(accept_header: str | None) -> Encoder | None:
+    if accept_header is None:
+        return None
+    encoder = _ENCODERS.get(accept_header)
+    if encoder is None and ("," in accept_header or ";" in accept_header):
+        # accept headers commonly carry a weighted list; resolve on the first
+        # media type and let the cache absorb the parsing for repeat headers
+        encoder = _ENCODERS.get(accept_header.split(",", 1)[0].split(";", 1)[0].strip())
+    return encoder
+
+
+if msgspec is not None:
+    _json_encode = _json_encoder
+else:
+
+    def _json_encode(data: Any) -> bytes:
+        return json.dumps(data).encode()
+
+
+_REDIRECT_SAFE = ":/%#?=@[]!$&'()*+,;"
+
+# URLs made up entirely of characters quote() would pass through (the safe
+# set above plus unreserved characters) need no quoting at all
+_SAFE_URL_RE = re.compile(r"[A-Za-z0-9:/%#?=@\[\]!$&'()*+,;._~-]*\Z")
+
+# headers repeat heavily across responses, so cache their encoded form; the
+# cache stops growing once full rather than evicting
+_ENCODED_HEADER_CACHE: dict[tuple[str, str], tuple[bytes, bytes]] = {}
+
+
+# pre-encoded content-type headers for the overwhelmingly common media types
+# (text/* entries assume the default utf-8 charset)
+_CT_ENCODED = {
+    "application/json": b"application/json",
+    "application/octet-stream": b"application/octet-stream",
+    "text/html": b"text/html; charset=utf-8",
+    "text/plain": b"text/plain; charset=utf-8",
+}
+
+# pre-encoded content-length values for small bodies (the common case)
+_CL_CACHE = [str(i).encode() for i in range(4096)]
+
+
+def _content_length_bytes(content_length: int) -> bytes:
+    return _CL_CACHE[content_length] if content_length < 4096 else str(content_length).encode()
+
+
+def _encode_header(key: str, value: str) -> tuple[bytes, bytes]:
+    pair = _ENCODED_HEADER_CACHE.get((key, value))
+    if pair is None:
+        pair = (key.lower().encode(), value.encode())
+        if len(_ENCODED_HEADER_CACHE) < 1024:
+            _ENCODED_HEADER_CACHE[(key, value)] = pair
+    return pair
+
+
+@lru_cache(maxsize=1024)
+def _quote_redirect(url: str) -> str:
+    return quote(url, safe=_REDIRECT_SAFE)
+
 
 class Response:
     charset = "utf-8"
 
+    __slots__ = ("body", "raw_body", "status_code", "_status_bytes", "media_type", "headers")
+
     def __init__(
         self,
         data: DataType = None,
@@ -36,41 +126,25 @@ class Response:
         self.body = data
         self.raw_body = data
         self.status_code = status_code
+        # pre-formatted status line for middleware/logging, so they never
+        # rebuild it per response
+        self._status_bytes = _STATUS_LINES.get(status_code, b"")
         self.media_type = media_type
-        self.headers = headers or {}
-
-    @property
-    def body(self) -> DataType:
-        return self._body
-
-    @body.setter
-    def body(self, data: DataType):
-        self.raw_body = data
-        self._body = data
+        self.headers: Optional[dict[str, str]] = headers or None
 
     def _msgspec_parsing(self, *, accept_header: str | None, state: State) -> bytes | None:
-        if msgspec is None:
-            return
-
-        if accept_header in ("application/x-yaml", "text/yaml"):
-            format_ = "yaml"
-        elif accept_header == "application/toml":
-            format_ = "toml"
-        elif accept_header == "application/json":
-            format_ = "json"
-        elif accept_header in ("application/msgpack", "application/x-msgpack"):
-            format_ = "msgpack"
-        else:
-            format_ = None
-
-        if format_ is None:
-            encoder = state.default_encoder
-        else:
-            encoder: Encoder = eval(f"msgspec.{format_}.encode")
-
+        encoder = _resolve_encoder(accept_header) or state.default_encoder
         return encoder(self.body)  # type: ignore
 
     def _parse_body(self, *, accept_header: str | None, state: State) -> bytes:
+        data = self.body
+        # bytes bodies are already serialized; send them as-is instead of
+        # round-tripping them through an encoder
+        if type(data) is bytes:
+            return data
+        if data is None:
+            return b""
+
         d = self._msgspec_parsing(accept_header=accept_header, state=state)
         if d is not None:
             return d
@@ -78,7 +152,7 @@ class Response:
         data = self.body
 
         if isinstance(data, (dict, list)):
-            data = json.dumps(data)
+            return _json_encode(data)
         if data is None:
             data = b""
         if isinstance(data, str):
@@ -87,34 +161,55 @@ class Response:
         assert isinstance(data, bytes)
         return data
 
+    def _content_type_bytes(self) -> bytes:
+        content_type = self.media_type
+        assert content_type is not None
+
+        ct = _CT_ENCODED.get(content_type) if self.charset == "utf-8" else None
+        if ct is None:
+            if content_type.startswith("text/"):
+                content_type += "; charset=" + self.charset
+            ct = content_type.encode()
+        return ct
+
     def _process_headers(self, content_length: int) -> list[tuple[bytes, bytes]]:
         headers = self.headers
 
+        if headers is None:
+            # most responses carry no custom headers, so skip the dict entirely
+            raw = [(b"content-length", _content_length_bytes(content_length))]
+            if self.media_type is not None:
+                raw.append((b"content-type", self._content_type_bytes()))
+            return raw
+
+        # build the raw list without writing back into the caller's dict
+        raw = [_encode_header(k, v) for k, v in headers.items()]
+
         if "content-length" not in headers:
-            headers["content-length"] = str(content_length)
+            raw.append((b"content-length", _content_length_bytes(content_length)))
         if self.media_type is not None and "content_type" not in headers:
-            content_type = self.media_type
-
-            if content_type.startswith("text/"):
-                content_type += "; charset=" + self.charset
-            headers["content-type"] = content_type
+            raw.append((b"content-type", self._content_type_bytes()))
 
-        return [(k.lower().encode(), v.encode()) for k, v in headers.items()]
+        return raw
 
     async def __call__(self, request: Request, *, bypass_formatter: bool = False) -> None:
-        if bypass_formatter is False:
-            self = await request.app._state.formatter(request, self)  # type: ignore
-
-        body = self._parse_body(accept_header=request.headers.get("accept", None), state=request.app._state)
-
-        await request._send(
-            {
-                "type": "http.response.start",
-                "status": self.status_code,
-                "headers": self._process_headers(len(body)),
-            }
-        )
-        await request._send({"type": "http.response.body", "body": body})
+        state = request.app._state
+        if bypass_formatter is False and state.has_formatter:
+            if self is _NOT_FOUND_RESPONSE or self is _METHOD_NOT_ALLOWED_RESPONSE or self is _INTERNAL_RESPONSE:
+                # formatters may mutate the response they're given; hand them a
+                # private copy so the shared instances stay pristine
+                self = Response(self.body, self.status_code)
+            self = await state.formatter(request, self)  # type: ignore
+
+        body = self._parse_body(accept_header=request.headers.get("accept", None), state=state)
+
+        start_msg = {
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self._process_headers(len(body)),
+        }
+        body_msg = {"type": "http.response.body", "body": body}
+        await request._send_response(start_msg, body_msg)  # type: ignore
 
     @classmethod
     def ok(cls, data: DataType = None, headers: Optional[dict[str, str]] = None) -> Self:
@@ -134,21 +229,49 @@ class Response:
 
     @classmethod
     def not_found(cls, data: Optional[Any] = None, headers: Optional[dict[str, str]] = None) -> Self:
+        if data is None and headers is None and cls is Response:
+            return _NOT_FOUND_RESPONSE  # type: ignore
         return cls(data, 404, headers=headers)
 
     @classmethod
     def internal(cls, data: DataType = None, headers: Optional[dict[str, str]] = None) -> Self:
+        if data is None and headers is None and cls is Response:
+            return _INTERNAL_RESPONSE  # type: ignore
         return cls(data, 500, headers=headers)
 
     @classmethod
     def redirect(cls, url: str, headers: Optional[dict[str, str]] = None):
         headers = headers or {}
-        headers["location"] = quote(url, safe=":/%#?=@[]!$&'()*+,;")
+        if _SAFE_URL_RE.match(url):
+            # quoting would be a no-op for typical internal URLs; skip it
+            headers["location"] = url
+        else:
+            # redirect targets tend to repeat (a handful of hot URLs), so cache
+            # the quoted form; oversized URLs skip the cache to bound its memory
+            headers["location"] = _quote_redirect(url) if len(url) <= 2048 else quote(url, safe=_REDIRECT_SAFE)
         return cls(b"", headers=headers)
 
     @classmethod
     def method_not_allowed(cls, data: DataType = None, headers: Optional[dict[str, str]] = None) -> Self:
+        if data is None and headers is None and cls is Response:
+            return _METHOD_NOT_ALLOWED_RESPONSE  # type: ignore
         return cls("Method Not Allowed" if data is None else data, 405, headers=headers)
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} status={self.status_code!r} media_type={self.media_type!r}>"
+
+
+# shared instances for the hot no-argument miss paths; nothing in the send
+# pipeline mutates a Response, so reuse is safe
+_NOT_FOUND_RESPONSE = Response(None, 404)
+_METHOD_NOT_ALLOWED_RESPONSE = Response("Method Not Allowed", 405)
+_INTERNAL_RESPONSE = Response(None, 500)
+
+
+if msgspec is None:
+    # msgspec availability is fixed at import, so swap in a no-op once instead
+    # of re-checking on every response
+    def _no_msgspec_parsing(self: Response, *, accept_header: str | None, state: State) -> None:
+        return None
+
+    Response._msgspec_parsing = _no_msgspec_parsing  # type: ignore
@@ -4,7 +4,9 @@ import inspect
 import json
 import re
 import traceback
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Mapping
+from functools import cache
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Generic, Literal, Type, TypeAlias, TypeVar, overload
 
 from ._types import Check, Connection, GroupT, HTTPCheck, Lifespan, Receive, Scope, Send, WSCheck, WSMessage
@@ -16,6 +18,11 @@ from .requests import WebSocket
 from .responses import Response
 from .utils import MISSING, mimmic, set_property
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 if TYPE_CHECKING:
     from msgspec import Struct
 
@@ -23,6 +30,14 @@ if TYPE_CHECKING:
 
     WSRouteT = TypeVar("WSRouteT", bound="WebSocketRoute")
 
+if msgspec is not None:
+    # a single reusable Decoder parses websocket JSON frames at C speed
+    _ws_json_decode = msgspec.json.Decoder().decode
+    _WSJSONDecodeError: tuple[Type[Exception], ...] = (msgspec.DecodeError,)
+else:
+    _ws_json_decode = json.loads
+    _WSJSONDecodeError = (json.JSONDecodeError,)
+
 
 __all__ = ("route", "Route", "WebSocketRoute")
 
@@ -40,6 +55,24 @@ RouteDecoCallbackType: TypeAlias = Callable[
 
 PATH_PARAM_REGEX = re.compile(r"{(?P<name>[a-zA-Z_][a-zA-Z0-9_]*)}")
 
+_METHOD_BITS = {"GET": 1, "POST": 2, "PUT": 4, "DELETE": 8, "PATCH": 16, "OPTIONS": 32, "HEAD": 64}
+
+# close codes arrive as plain ints; a dict probe avoids the Enum __call__
+# machinery per disconnect and tolerates non-registered codes (e.g. 4xxx)
+_WS_CODE_MAP = {code.value: code for code in WSCodes}
+
+# one shared instance per converter class; converters are stateless, so every
+# route using the same annotation reuses the same object
+_CONVERTER_SINGLETONS: dict[Any, Converter] = {typ: conv() for typ, conv in builtin_converters.items()}
+
+# shared between every param-less request; wrapped in a read-only proxy so a
+# handler mutating request.path_params cannot poison other requests
+_EMPTY_PATH_PARAMS: Mapping[str, Any] = MappingProxyType({})
+
+# signature introspection is expensive and callbacks are hashable; memoize it
+# so re-registration (groups, multiple apps) never re-walks a callback
+_cached_signature = cache(inspect.signature)
+
 
 class _DefaultLifespan:
     def __init__(self, app) -> None:
@@ -55,11 +88,29 @@ class _DefaultLifespan:
 class BaseRoute(Generic[GroupT]):
     _group: GroupT | None
     _state: State
-    _path_data: list[tuple[str, tuple[Converter, str] | None]]
+    _path_data: list[tuple[re.Pattern[str], tuple[Callable[[str], Any], str] | None]]
     description: str
     _parameters: list[Parameter]
     _checks: list[Check]
 
+    __slots__ = (
+        "_group",
+        "_state",
+        "_path",
+        "_add_prefix",
+        "_resolved",
+        "_path_params_added",
+        "_compiled",
+        "_checks",
+        "_parameters",
+        "_path_data",
+        "_full_regex",
+        "_param_extras",
+        "_segment_count",
+        "_extract_params",
+        "_params_cacheable",
+    )
+
     def __init__(self, *, path: str, prefix: bool) -> None:
         if not path.startswith("/"):
             raise ValueError(f"Route paths must start with '/'")
@@ -70,6 +121,7 @@ class BaseRoute(Generic[GroupT]):
         self._group = None
         self._resolved = None
         self._path_params_added: bool = False
+        self._compiled: bool = False
         self._checks = []
 
     @property
@@ -85,7 +137,7 @@ class BaseRoute(Generic[GroupT]):
         x = []
         for regex, extra in self._path_data:
             if extra is None:
-                x.append(regex)
+                x.append(regex.pattern)
             else:
                 x.append(f"{{{extra[1]}}}")
         return "/".join(x)
@@ -97,7 +149,7 @@ class BaseRoute(Generic[GroupT]):
     def _get_path_params(self, signature: inspect.Signature) -> dict[str, PathParameter]:
         params = {}
         skipped_conn: bool = False
-        for name, arg in dict(signature.parameters).items():
+        for name, arg in signature.parameters.items():
             if name == "self":
                 continue
             if skipped_conn is False:
@@ -110,69 +162,106 @@ class BaseRoute(Generic[GroupT]):
         return params
 
     def _compile_path(self, signature: inspect.Signature) -> None:
-        path: list[tuple[str, tuple[Converter, str] | None]] = []
+        path: list[tuple[re.Pattern[str], tuple[Callable[[str], Any], str] | None]] = []
         path_params = self._get_path_params(signature)
+        cacheable = True
 
         for endpoint in self.path.split("/"):
             extra = None
             regex = re.escape(endpoint)
 
-            if match := PATH_PARAM_REGEX.fullmatch(endpoint):
+            if "{" in endpoint and (match := PATH_PARAM_REGEX.fullmatch(endpoint)):
                 name = match["name"]
                 param = path_params.pop(name, None)
                 if param is not None:
                     annotation = param.annotation
-                    if not issubclass(annotation, Converter):
-                        converter = builtin_converters.get(annotation, None)
-                    else:
-                        converter = annotation
-
+                    converter = _CONVERTER_SINGLETONS.get(annotation)
                     if converter is None:
-                        raise ConverterNotFound(
-                            f"I found no converter for {annotation!r}. To impliment one yourself, have it override `starapi.Converter`, and override the `convert` method."
-                        )
-                    try:
-                        converter = converter()
-                    except TypeError as e:
-                        if "missing 1 required positional argument" in str(
-                            e
-                        ) or "missing 1 required keyword-only argument" in str(e):
-                            raise ConverterEntryNotFound(converter)
-                        else:
-                            raise
-                    extra = converter, name
+                        try:
+                            is_converter = issubclass(annotation, Converter)
+                        except TypeError:
+                            is_converter = False
+
+                        if not is_converter:
+                            raise ConverterNotFound(
+                                f"I found no converter for {annotation!r}. To impliment one yourself, have it override `starapi.Converter`, and override the `convert` method."
+                            )
+                        try:
+                            converter = annotation()
+                        except TypeError as e:
+                            raise ConverterEntryNotFound(annotation) from e
+                        _CONVERTER_SINGLETONS[annotation] = converter
+                    if not converter.pure:
+                        cacheable = False
+                    # bind the convert method now so _match skips the
+                    # attribute lookup on every request
+                    extra = converter.convert, name
                     regex = converter.regex
 
-            path.append((regex, extra))
+            # compile here so _match never goes through re's pattern cache
+            path.append((re.compile(regex), extra))
 
         if path_params:
             raise RuntimeError(
                 f"Unknown path parameters in '{self.path}': {', '.join(f'{param.name!r}' for param in path_params.values())}"
             )
 
-        if path[-1][0] != "":
-            path.append(("", None))
+        if path[-1][0].pattern != "":
+            path.append((re.compile(""), None))
 
         self._path_data = path
 
+        # fuse the per-segment patterns into one anchored regex so matching a
+        # route is a single C-level call instead of a Python loop per segment
+        full = []
+        extras = []
+        for regex, extra in path:
+            if extra is None:
+                full.append(regex.pattern)
+            else:
+                full.append(f"(?P<{extra[1]}>{regex.pattern})")
+                extras.append(extra)
+        self._full_regex = re.compile("/".join(full))
+        self._param_extras = tuple(extras)
+        self._segment_count = len(path)
+        # routes with impure converters must re-convert on every request
+        self._params_cacheable = cacheable
+
+        # generate a flat extractor per route: a single BUILD_MAP with the
+        # converters closed over, instead of looping pairs on every match
+        if extras:
+            ns = {f"_conv{i}": conv for i, (conv, _) in enumerate(extras)}
+            items = ", ".join(f"{name!r}: _conv{i}(m[{name!r}])" for i, (_, name) in enumerate(extras))
+            exec(f"def _extract(m): return {{{items}}}", ns)
+            self._extract_params = ns["_extract"]
+        else:
+            self._extract_params = None
+
+        self._compiled = True
+
     def _match(self, con: Connection) -> bool:
-        client_path = con._scope["path"].split("/")
+        scope = con._scope
+        path = scope["path"]
 
-        if len(client_path) != len(self._path_data):
+        # the slash count guards converters whose patterns could otherwise
+        # swallow a separator (e.g. a bare '.*'), keeping per-segment semantics
+        if path.count("/") + 1 != self._segment_count:
             return False
 
-        params = {}
+        m = self._full_regex.fullmatch(path)
+        if m is None:
+            return False
+
+        extract = self._extract_params
+        if extract is None:
+            scope["path_params"] = {}
+            return True
 
-        for client_endpoint, server_endpoint in zip(client_path, self._path_data):
-            regex, extra = server_endpoint
-            if not re.fullmatch(regex, client_endpoint):
-                return False
-            if extra is not None:
-                try:
-                    params[extra[1]] = extra[0].convert(client_endpoint)
-                except ValueError:
-                    return False
-        con._scope["path_params"] = params
+        try:
+            params = extract(m)
+        except ValueError:
+            return False
+        scope["path_params"] = params
         return True
 
     def __repr__(self, extras: list = MISSING) -> str:
@@ -191,6 +280,19 @@ class Route(BaseRoute):
     callback: HTTPRouteCallback
     _checks: list[HTTPCheck]
 
+    __slots__ = (
+        "callback",
+        "hidden",
+        "deprecated",
+        "_methods",
+        "_method_mask",
+        "_methods_set",
+        "_responses",
+        "_tags",
+        "_payload",
+        "_dispatch",
+    )
+
     def __init__(
         self,
         path: str,
@@ -211,6 +313,21 @@ class Route(BaseRoute):
         if methods is MISSING:
             self._methods = ["GET", "HEAD"]
 
+        self._dispatch: Callable[[Connection], Coroutine[Any, Any, None]] | None = None
+
+        # collapse the per-request membership test into one bitwise AND; -1
+        # marks a non-standard method so __call__ falls back to the list
+        mask = 0
+        for method in self._methods:
+            bit = _METHOD_BITS.get(method)
+            if bit is None:
+                mask = -1
+                break
+            mask |= bit
+        self._method_mask = mask
+        # O(1) containment for the non-standard-method fallback path
+        self._methods_set = frozenset(self._methods)
+
         self.hidden = hidden
 
         self._responses = responses or {}
@@ -236,46 +353,89 @@ class Route(BaseRoute):
     def methods(self) -> list[str]:
         return self._methods
 
-    def _match(self, request: Connection) -> bool:
-        if request._type != "http":
-            return False
+    def _build_dispatch(self) -> Callable[[Connection], Coroutine[Any, Any, None]]:
+        """Partially evaluate this route's shape into a specialized handler.
 
-        return super()._match(request)
+        The group/no-group and checks/no-checks branches are decided once
+        here instead of on every request. Checks are frozen at this point,
+        which happens on the first request -- well after decorators have run.
+        """
 
-    async def __call__(self, request: Connection) -> None:
-        assert request._type == "http"
+        group = self._group
+        state = self._state
+        callback = self.callback
+        checks = self._checks + getattr(callback, "__starapi_checks__", [])
 
-        if request.method not in self.methods:
-            return await Response.method_not_allowed()(request)
+        if group is None:
+            if not checks:
 
-        request._scope["endpoint"] = self
+                async def dispatch(request: Connection) -> None:
+                    try:
+                        response = await callback(request, **request._scope["path_params"])
+                    except Exception as e:
+                        response = await state.on_route_error(request, e)
+                    await response(request)
 
-        args = []
+            else:
 
-        response = None
-        if self._group is not None:
-            args.append(self._group)
+                async def dispatch(request: Connection) -> None:
+                    for check in checks:
+                        value = await check(request)
+                        if isinstance(value, Response):
+                            response = value
+                            break
+                    else:
+                        try:
+                            response = await callback(request, **request._scope["path_params"])
+                        except Exception as e:
+                            response = await state.on_route_error(request, e)
+                    await response(request)
 
-            try:
-                response = await self._group.group_check(request)
-            except Exception as e:
-                response = await self._state.on_route_error(request, e)
-
-        if response is None:
-            for check in self._checks + getattr(self.callback, "__starapi_checks__", []):
-                value = await check(request)
-                if isinstance(value, Response):
-                    response = value
-                    break
-            else:
-                args.append(request)
+        else:
+            from .groups import Group
 
-                try:
-                    response = await self.callback(*args, **request._scope["path_params"])
-                except Exception as e:
-                    response = await self._state.on_route_error(request, e)
+            group_check = None if type(group).group_check is Group.group_check else group.group_check
 
-        await response(request)
+            async def dispatch(request: Connection) -> None:
+                response = None
+                if group_check is not None:
+                    try:
+                        response = await group_check(request)
+                    except Exception as e:
+                        response = await state.on_route_error(request, e)
+
+                if response is None:
+                    for check in checks:
+                        value = await check(request)
+                        if isinstance(value, Response):
+                            response = value
+                            break
+                    else:
+                        try:
+                            response = await callback(group, request, **request._scope["path_params"])
+                        except Exception as e:
+                            response = await state.on_route_error(request, e)
+
+                await response(request)
+
+        return dispatch
+
+    async def __call__(self, request: Connection) -> None:
+        assert request._type == "http"
+
+        mask = self._method_mask
+        if mask >= 0:
+            if not mask & _METHOD_BITS.get(request.method, 0):
+                return await Response.method_not_allowed()(request)
+        elif request.method not in self._methods_set:
+            return await Response.method_not_allowed()(request)
+
+        request._scope["endpoint"] = self
+
+        dispatch = self._dispatch
+        if dispatch is None:
+            dispatch = self._dispatch = self._build_dispatch()
+        await dispatch(request)
 
     def __repr__(self) -> str:
         return super().__repr__(["methods", "hidden"])
@@ -307,6 +467,9 @@ class WebSocketRoute(BaseRoute):
 
         self._parameters = []
 
+        # resolved once; whether the subclass actually overrides on_receive
+        self._has_on_receive = not getattr(type(self).on_receive, "__starapi_original__", False)
+
         super().__init__(path=path, prefix=prefix)
 
     def __init_subclass__(
@@ -317,12 +480,6 @@ class WebSocketRoute(BaseRoute):
     ) -> None:
         cls._init_subclass_kwarg_data = path, prefix
 
-    def _match(self, ws: Connection) -> bool:
-        if ws._type != "websocket":
-            return False
-
-        return super()._match(ws)
-
     @property
     def description(self) -> str:
         return self.__doc__ or ""
@@ -342,20 +499,22 @@ class WebSocketRoute(BaseRoute):
             await self._state.on_ws_error(ws, e)
             await self.on_disconnect(ws, WSCodes.INTERNAL_ERROR)
 
-        if getattr(self.on_receive, "__starapi_original__", False) is True:
+        if not self._has_on_receive:
             return
 
         close_code = WSCodes.NORMAL_CLOSURE
         try:
             while 1:
                 msg = await ws.receive()
-                match WSMessageType(msg["type"]):
-                    case WSMessageType.receive:
-                        await self._dispatch_receive(ws, msg)
-                    case WSMessageType.disconnect:
-                        code = msg.get("code", None)
-                        close_code = WSCodes(code) if code is not None else WSCodes.NORMAL_CLOSURE
-                        break
+                # compare the raw type string; building a WSMessageType per
+                # frame costs an enum lookup on every message, and receive()
+                # already rejects anything but these two types
+                msg_type = msg["type"]
+                if msg_type == "websocket.receive":
+                    await self._dispatch_receive(ws, msg)
+                elif msg_type == "websocket.disconnect":
+                    close_code = _WS_CODE_MAP.get(msg.get("code"), WSCodes.NORMAL_CLOSURE)
+                    break
         except Exception as e:
             await self._state.on_ws_error(ws, e)
             close_code = WSCodes.INTERNAL_ERROR
@@ -372,8 +531,8 @@ class WebSocketRoute(BaseRoute):
                 data = msg.get("text", msg.get("bytes"))
                 if data is not None:
                     try:
-                        data = json.loads(data)
-                    except json.JSONDecodeError:
+                        data = _ws_json_decode(data)
+                    except _WSJSONDecodeError:
                         await ws.close(WSCodes.UNSUPPORTED_DATA)
                         raise RuntimeError("Malformed JSON data received")
 
@@ -511,20 +670,121 @@ class RouteSelector:
 route = RouteSelector()
 
 
+class _TrieNode:
+    __slots__ = ("static", "param", "routes")
+
+    def __init__(self) -> None:
+        self.static: dict[str, _TrieNode] = {}
+        self.param: _TrieNode | None = None
+        self.routes: list[tuple[int, RouteType]] = []
+
+
 class Router:
     routes: list[RouteType]
     lifespan_context: Lifespan
 
+    __slots__ = (
+        "routes",
+        "lifespan_context",
+        "_has_lifespan",
+        "_static_index",
+        "_dynamic_routes",
+        "_tries",
+        "_match_cache",
+        "_indexed",
+    )
+
     def __init__(self, *, lifespan: Lifespan = MISSING) -> None:
         self.routes = []
 
+        self._static_index: dict[tuple[str, str], tuple[RouteType, str]] = {}
+        self._dynamic_routes: list[RouteType] = []
+        self._tries: dict[str, _TrieNode] = {"http": _TrieNode(), "websocket": _TrieNode()}
+        # resolved (type, path) -> (route, path_params) for repeat traffic;
+        # bounded by simply not growing past 1024 distinct paths
+        self._match_cache: dict[tuple[str, str], tuple[RouteType, dict[str, Any]]] = {}
+        self._indexed: int = 0
+
+        self._has_lifespan = bool(lifespan)
         self.lifespan_context = lifespan or _DefaultLifespan
 
+    def _reindex(self) -> None:
+        """Split routes into an exact-path table and a scan list.
+
+        Routes without path params can be dispatched with one dict lookup
+        instead of a regex match per registered route; only parameterised
+        routes stay on the linear scan.
+        """
+
+        static: dict[tuple[str, str], tuple[RouteType, str]] = {}
+        dynamic: list[RouteType] = []
+
+        for route in self.routes:
+            type_ = "http" if isinstance(route, Route) else "websocket"
+            if all(extra is None for _, extra in route._path_data):
+                path = route.path if route.path.endswith("/") else route.path + "/"
+                # index the slash-less spelling too, so requests missing the
+                # trailing slash dispatch without building a new path string
+                static.setdefault((type_, path), (route, path))
+                if path != "/":
+                    static.setdefault((type_, path[:-1]), (route, path))
+            else:
+                dynamic.append(route)
+
+        self._static_index = static
+        self._dynamic_routes = dynamic
+
+        # trie over the parameterised routes: static segments become exact
+        # edges, params a catch-all edge, so lookups only visit routes whose
+        # static skeleton fits the path
+        roots = {"http": _TrieNode(), "websocket": _TrieNode()}
+        for index, route in enumerate(dynamic):
+            root = roots["http" if isinstance(route, Route) else "websocket"]
+            segments = route.path.split("/")
+            if segments[-1] != "":
+                segments.append("")
+
+            node = root
+            for segment, (_, extra) in zip(segments, route._path_data):
+                if extra is None:
+                    child = node.static.get(segment)
+                    if child is None:
+                        child = node.static[segment] = _TrieNode()
+                else:
+                    child = node.param
+                    if child is None:
+                        child = node.param = _TrieNode()
+                node = child
+            node.routes.append((index, route))
+
+        self._tries = roots
+        self._match_cache.clear()
+        self._indexed = len(self.routes)
+
+    def _trie_collect(self, node: _TrieNode, segments: list[str], i: int, out: list[tuple[int, RouteType]]) -> None:
+        if i == len(segments):
+            out.extend(node.routes)
+            return
+        child = node.static.get(segments[i])
+        if child is not None:
+            self._trie_collect(child, segments, i + 1, out)
+        if node.param is not None:
+            self._trie_collect(node.param, segments, i + 1, out)
+
     async def lifespan(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Handle ASGI lifespan messages, which allows us to manage application
         startup and shutdown events.
         """
+        if not self._has_lifespan:
+            # no user context to run; answer the protocol directly without the
+            # async-with plumbing around the no-op default
+            await receive()
+            await send({"type": "lifespan.startup.complete"})
+            await receive()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
         started = False
         await receive()
         try:
@@ -536,8 +796,10 @@ class Router:
                 await send({"type": "lifespan.startup.complete"})
                 started = True
                 await receive()
-        except Exception:
-            exc_text = traceback.format_exc()
+        except Exception as e:
+            # build the text from the exception object itself; format_exc()
+            # would re-fetch exc_info and capture frame locals we don't need
+            exc_text = "".join(traceback.TracebackException.from_exception(e).format())
             if started:
                 await send({"type": "lifespan.shutdown.failed", "message": exc_text})
             else:
@@ -547,16 +809,52 @@ class Router:
             await send({"type": "lifespan.shutdown.complete"})
 
     async def __call__(self, request: Connection) -> None:
-        assert request._scope["type"] in ("http", "websocket")
-
-        if not request._scope["path"].endswith("/"):
-            request._scope["path"] += "/"
-
-        for route in self.routes:
+        # Application.__call__ has already branched on scope["type"]; only
+        # http/websocket connections can reach the router
+
+        # keep the dispatch loop on locals; every attribute/dict hop here is
+        # paid once per request times once per dynamic route
+        scope = request._scope
+        path = scope["path"]
+
+        if self._indexed != len(self.routes):
+            self._reindex()
+
+        entry = self._static_index.get((scope["type"], path))
+        if entry is not None:
+            route, canonical = entry
+            scope["path"] = canonical
+            scope["path_params"] = _EMPTY_PATH_PARAMS
+            return await route(request)
+
+        if not path.endswith("/"):
+            path += "/"
+            scope["path"] = path
+
+        key = (scope["type"], path)
+
+        hit = self._match_cache.get(key)
+        if hit is not None:
+            route, params = hit
+            # hand out a copy; handlers may mutate request.path_params
+            scope["path_params"] = dict(params)
+            return await route(request)
+
+        candidates: list[tuple[int, RouteType]] = []
+        self._trie_collect(self._tries[scope["type"]], path.split("/"), 0, candidates)
+        if len(candidates) > 1:
+            # registration order decides between overlapping routes
+            candidates.sort(key=lambda entry: entry[0])
+
+        for _, route in candidates:
             if route._match(request) is True:
+                if route._params_cacheable and len(self._match_cache) < 1024:
+                    # store a private copy; the scope's dict is about to be
+                    # exposed to (and possibly mutated by) the handler
+                    self._match_cache[key] = (route, dict(scope["path_params"]))
                 return await route(request)
 
-        if request._scope["path"] == "/openapi.json/":
+        if path == "/openapi.json/":
             if await self.handle_openapi_route(request) is True:
                 return
 
@@ -1,10 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 
 from .errors import DependencyException
-from .requests import Request
-from .responses import Response
 from .utils import mimmic
 
 if TYPE_CHECKING:
@@ -21,8 +19,18 @@ else:
 
 __all__ = ("Server",)
 
+# canned messages for prefix misses; built once, reused verbatim
+_NOT_FOUND_START = {
+    "type": "http.response.start",
+    "status": 404,
+    "headers": [(b"content-length", b"0")],
+}
+_NOT_FOUND_BODY = {"type": "http.response.body", "body": b""}
+
 
 class BaseASGIApp:
+    __slots__ = ()
+
     @mimmic(uvicorn.run, keep_return=True)
     def run(self, *args, **kwargs) -> None:
         """
@@ -61,17 +69,28 @@ class BaseASGIApp:
 
 
 class Server(BaseASGIApp):
+    __slots__ = ("_apps", "case_insensitive", "_normalize")
+
     def __init__(self, *, case_insensitive: bool = False) -> None:
         self._apps: dict[str, Application] = {}
         self.case_insensitive = case_insensitive
+        # picked once for the configured mode; both are C-level callables
+        # (str on a str returns the same object)
+        self._normalize: Callable[[str], str] = str.lower if case_insensitive else str
 
     async def handle_404(self, scope: Scope, receive: Receive, send: Send) -> None:
-        request = Request(scope, receive, send)
-        await Response.not_found()(request)
+        # a prefix miss never had an app attached to the scope, so skip the
+        # Request/Response machinery and answer with the canned messages
+        if scope["type"] == "websocket":
+            await send({"type": "websocket.close", "code": 1000, "reason": ""})
+            return
+        await send(_NOT_FOUND_START)
+        await send(_NOT_FOUND_BODY)
 
     def register_app(self, app: Application, *, prefix: str) -> None:
         if self.case_insensitive:
-            prefix = prefix.strip().lower()
+            prefix = prefix.strip()
+        prefix = self._normalize(prefix)
 
         if prefix in self._apps:
             raise ValueError(f"An app has already been registered with the '{prefix}'")
@@ -81,18 +100,26 @@ class Server(BaseASGIApp):
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         assert scope["type"] in ("http", "lifespan", "websocket")
 
-        path: str = scope["path"]
-        endpoints: list[str] = path.split("/")
-        prefix = endpoints.pop(1)
-        while len(endpoints) <= 1:
-            endpoints.append("")
-
-        scope["path"] = "/".join(endpoints)
+        if scope["type"] == "lifespan":
+            # lifespan scopes carry no path to route by, so the registered
+            # apps never see them; answer the protocol here
+            await receive()
+            await send({"type": "lifespan.startup.complete"})
+            await receive()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
 
-        if self.case_insensitive:
-            prefix = prefix.lower()
+        # route on the first segment with find/slice only; no list, no join
+        path: str = scope["path"]
+        end = path.find("/", 1)
+        if end == -1:
+            prefix = path[1:]
+            scope["path"] = "/"
+        else:
+            prefix = path[1:end]
+            scope["path"] = path[end:]
 
-        app = self._apps.get(prefix, None)
+        app = self._apps.get(self._normalize(prefix), None)
         if app is None:
             await self.handle_404(scope, receive, send)
         else:
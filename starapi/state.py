@@ -22,6 +22,16 @@ if TYPE_CHECKING:
 
 __all__ = ("State",)
 
+if msgspec is not None:
+    # resolved once at import; State construction no longer re-tests msgspec
+    # availability. The decoder stays the module function: callers pass type=
+    # per call, which Decoder instances do not accept, while the Encoder
+    # instance reuses its output buffer across calls.
+    _DEFAULT_ENCODER = msgspec.json.Encoder().encode
+    _DEFAULT_DECODER = msgspec.json.decode
+else:
+    _DEFAULT_ENCODER = _DEFAULT_DECODER = None
+
 
 class State:
     docs: OpenAPI | None
@@ -29,6 +39,18 @@ class State:
     default_decoder: Decoder
     formatter: ResponseFormatter
 
+    __slots__ = (
+        "app",
+        "router",
+        "cached_api_docs",
+        "formatter",
+        "has_formatter",
+        "groups",
+        "docs",
+        "default_encoder",
+        "default_decoder",
+    )
+
     def __init__(
         self,
         app: Application,
@@ -41,19 +63,20 @@ class State:
     ):
         self.app = app
         self.router = Router(lifespan=lifespan)
-        self.cached_api_docs: dict | None = None
+        self.cached_api_docs: OpenAPI | None = None
         self.formatter = formatter or ResponseFormatter()
+        # the base formatter is a no-op; remembering that here lets responses
+        # skip a coroutine round-trip per request
+        self.has_formatter = type(self.formatter) is not ResponseFormatter
 
         self.groups: list[Group] = []
         self.docs = docs or None
 
-        if msgspec is not None:
-            self.default_decoder = default_decoder or msgspec.json.decode  # type: ignore
-            self.default_encoder = default_encoder or msgspec.json.encode
+        self.default_decoder = default_decoder or _DEFAULT_DECODER  # type: ignore
+        self.default_encoder = default_encoder or _DEFAULT_ENCODER  # type: ignore
 
     async def on_route_error(self, request: Request, error: Exception) -> Response:
         route = request.endpoint
-        assert route is not None
 
         response = None
         if route._group is not None:
@@ -68,7 +91,6 @@ class State:
 
     async def on_ws_error(self, ws: WebSocket, error: Exception) -> None:
         route = ws.endpoint
-        assert route is not None
 
         if route._group is not None:
             await route._group.on_ws_error(ws, error)
@@ -79,10 +101,14 @@ class State:
         if self.docs is None:
             return
 
-        if self.docs.is_populated is False:
-            for route in self.router.routes:
-                if isinstance(route, Route):
-                    self.docs.add_route(route)
-            self.docs._add_models_from_queue()
-
-        return self.docs
+        # populate exactly once; every openapi request previously re-walked
+        # the route table and rebuilt the component schemas
+        if self.cached_api_docs is None:
+            if self.docs.is_populated is False:
+                for route in self.router.routes:
+                    if isinstance(route, Route):
+                        self.docs.add_route(route)
+                self.docs._add_models_from_queue()
+            self.cached_api_docs = self.docs
+
+        return self.cached_api_docs
@@ -28,23 +28,25 @@ FuncT = TypeVar("FuncT", bound=Callable)
 P = ParamSpec("P")
 
 
-def _cached_property(func: Callable):
-    name = func.__name__
+class _cached_property:
+    """functools-style cached property.
 
-    @wraps(func)
-    def getter(parent: Type):
-        cache = getattr(parent, "__cached_properties", None)
-        if cache is None:
-            cache = {}
-            parent.__cached_properties = cache
-
-        if name not in cache.keys():
-            cache[name] = func(parent)
-            parent.__cached_properties = cache
+    A non-data descriptor that stores the computed value in the instance's
+    __dict__ under its own name, so every access after the first resolves
+    through the normal C-level attribute lookup without re-entering __get__.
+    """
 
-        return parent.__cached_properties[name]
+    def __init__(self, func: Callable) -> None:
+        self.func = func
+        self.attrname = func.__name__
+        self.__doc__ = func.__doc__
 
-    return property(getter)
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self.func(instance)
+        instance.__dict__[self.attrname] = value
+        return value
 
 
 if TYPE_CHECKING:
@@ -91,15 +93,15 @@ def cached_coro(coro: CoroT) -> CoroT:
 
     @wraps(coro)
     async def wrapped(parent: Type):
-        cache = getattr(parent, "__cached_properties", None)
+        cache = getattr(parent, "_cached_properties", None)
         if cache is None:
             cache = {}
-            parent.__cached_properties = cache
+            parent._cached_properties = cache
 
-        if name not in cache.keys():
+        if name not in cache:
             cache[name] = await coro(parent)
 
-        return parent.__cached_properties[name]
+        return parent._cached_properties[name]
 
     return wrapped  # type: ignore
 
@@ -109,45 +111,46 @@ def cached_gen(coro: GenT) -> GenT:
 
     @wraps(coro)
     async def wrapped(parent: Type):
-        cache = getattr(parent, "__cached_properties", None)
+        cache = getattr(parent, "_cached_properties", None)
         if cache is None:
             cache = {}
-            parent.__cached_properties = cache
+            parent._cached_properties = cache
 
         obj = coro(parent)
 
-        if name not in cache.keys():
+        if name not in cache:
             items = []
             async for item in obj:
                 items.append(item)
 
             cache[name] = items
 
-        for item in parent.__cached_properties[name]:
+        for item in parent._cached_properties[name]:
             yield item
 
     return wrapped  # type: ignore
 
 
+_DEFAULT_PORTS = {"http": 80, "https": 443, "ws": 80, "wss": 443}
+
+
 def url_from_scope(scope: Scope) -> URL:
     scheme = scope.get("scheme", "http")
     server = scope.get("server", None)
-    path = scope.get("root_path", "") + scope["path"]
+    root_path = scope.get("root_path", "")
+    # root_path is almost always empty; skip the concat when it is
+    path = root_path + scope["path"] if root_path else scope["path"]
     query_string = scope.get("query_string", b"")
 
-    host_header = None
-    for key, value in scope["headers"]:
-        if key == b"host":
-            host_header = value.decode("latin-1")
-            break
+    host_header = next((value for key, value in scope["headers"] if key == b"host"), None)
 
     if host_header is not None:
-        url = f"{scheme}://{host_header}{path}"
+        url = f"{scheme}://{host_header.decode('latin-1')}{path}"
     elif server is None:
         url = path
     else:
         host, port = server
-        default_port = {"http": 80, "https": 443, "ws": 80, "wss": 443}[scheme]
+        default_port = _DEFAULT_PORTS[scheme]
         if port == default_port:
             url = f"{scheme}://{host}{path}"
         else:
@@ -161,12 +164,17 @@ def url_from_scope(scope: Scope) -> URL:
 def parse_cookies(before: str, /) -> dict:
     after = {}
 
-    for chunk in before.split(";"):
-        if "=" in chunk:
-            name, value = chunk.split("=", 1)
-        else:
-            name, value = "", chunk
+    pos = 0
+    while 1:
+        cut = before.find(";", pos)
+        chunk = before[pos:] if cut == -1 else before[pos:cut]
+        name, sep, value = chunk.partition("=")
+        if not sep:
+            name, value = "", name
         after[name.strip()] = unqoute(value.strip())
+        if cut == -1:
+            break
+        pos = cut + 1
     return after
 
 
@@ -180,17 +188,22 @@ class AsyncIteratorProxy(Generic[ReturnT]):
         self._coro = coro
         self._exit_exception = exit_exception
 
-    async def __aiter__(self) -> Self:
+    def __aiter__(self) -> Self:
         return self
 
     def __anext__(self) -> Coroutine[Any, Any, ReturnT]:
+        # no exit exception -> hand the coroutine straight through; the
+        # old try/except here was dead code, since the exception can only
+        # surface when the coroutine is awaited
         if self._exit_exception is None:
             return self._coro()
-        else:
-            try:
-                return self._coro()
-            except self._exit_exception:
-                raise StopAsyncIteration
+        return self._guarded()
+
+    async def _guarded(self) -> ReturnT:
+        try:
+            return await self._coro()
+        except self._exit_exception:  # type: ignore
+            raise StopAsyncIteration
 
 
 def set_property(name: str, value: Any) -> Callable[[FuncT], FuncT]:
@@ -216,10 +229,10 @@ def mimmic(
     keep_return: bool = False,
 ) -> Callable[[Callable], Callable[P, Optional[ReturnT]]]:
     def decorator(real_function: Callable) -> Callable[P, Optional[ReturnT]]:
-        @wraps(this)
-        def new_function(*args: P.args, **kwargs: P.kwargs) -> Optional[ReturnT]:
-            return real_function(*args, **kwargs)
-
-        return new_function
+        # mimmic only exists for type checkers/introspection; point
+        # __wrapped__ at the mimicked callable instead of paying a wrapper
+        # frame on every call
+        real_function.__wrapped__ = this
+        return real_function
 
     return decorator